@@ -1,12 +1,23 @@
+import os
+import tempfile
+
+# Patch the stdlib for gevent before anything else imports it
+# (gunicorn's gevent worker does this itself; the flag covers other runners)
+if os.environ.get("GEVENT_PATCH") == "1":
+    from gevent import monkey
+    monkey.patch_all()
+
 from flask import Flask, render_template, request, jsonify
 from flask_cors import CORS
-import os
-from werkzeug.utils import secure_filename
 
 from config import Config
-from models.course_manager import CourseManager
-from models.resume_processor import ResumeProcessor
-from models.recommendation_engine import RecommendationEngine
+from services import (
+    get_course_manager,
+    get_resume_processor,
+    get_recommendation_engine,
+    get_job_store,
+    get_job_executor,
+)
 
 # ----------------------------------
 # App setup
@@ -17,25 +28,6 @@ app.config.from_object(Config)
 # ✅ ENABLE CORS FOR ALL ROUTES (REQUIRED FOR REACT)
 CORS(app, supports_credentials=True)
 
-# ----------------------------------
-# Prepare upload folder
-# ----------------------------------
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-
-# ----------------------------------
-# Initialize components (load once)
-# ----------------------------------
-print("Loading course data...")
-course_manager = CourseManager()
-
-print("Initializing resume processor...")
-resume_processor = ResumeProcessor()
-
-print("Initializing recommendation engine...")
-recommendation_engine = RecommendationEngine(course_manager)
-
-print("MOOC Resume Feature API ready!")
-
 # ----------------------------------
 # Helpers
 # ----------------------------------
@@ -51,12 +43,16 @@ def allowed_file(filename: str) -> bool:
 # ----------------------------------
 @app.route("/")
 def index():
-    stats = course_manager.get_statistics()
+    stats = get_course_manager().get_statistics()
     return render_template("index.html", stats=stats)
 
 # ----------------------------------
 # Upload Resume (API)
 # ----------------------------------
+# Processing is asynchronous: a successful upload returns 202 with a job_id,
+# and clients (the bundled UI and the external React app alike) poll
+# GET /upload/<job_id> until its status is "done" (200, full results) or
+# "error" (500). It no longer answers 200 with the results directly.
 @app.route("/upload", methods=["POST", "OPTIONS"])
 def upload_resume():
     # ✅ Handle CORS preflight
@@ -79,20 +75,67 @@ def upload_resume():
     filepath = None
 
     try:
-        # Save file
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-        file.save(filepath)
+        # Stream the upload into a temp file owned by the background job
+        # (the extension was validated by allowed_file above)
+        suffix = "." + file.filename.rsplit(".", 1)[1].lower()
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            filepath = tmp.name
+            file.save(tmp, buffer_size=64 * 1024)
+
+        # Queue processing so the HTTP worker is freed immediately
+        job_id = get_job_store().create()
+        get_job_executor().submit(process_resume_job, job_id, filepath)
 
+    except Exception as e:
+        print("Upload error:", e)
+        if filepath and os.path.exists(filepath):
+            os.remove(filepath)
+        return jsonify({
+            "error": "Failed to process resume"
+        }), 500
+
+    return jsonify({
+        "job_id": job_id,
+        "status": "queued"
+    }), 202
+
+@app.route("/upload/<job_id>")
+def get_upload_job(job_id):
+    job = get_job_store().get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+
+    if job["status"] == "done":
+        return jsonify({
+            "job_id": job_id,
+            "status": "done",
+            **job["result"]
+        }), 200
+
+    if job["status"] == "error":
+        return jsonify(job), 500
+
+    return jsonify(job), 200
+
+# ----------------------------------
+# Background resume job
+# ----------------------------------
+def process_resume_job(job_id, filepath):
+    job_store = get_job_store()
+    job_store.update(job_id, "processing")
+
+    try:
         # Process resume
-        analysis = resume_processor.process_resume(filepath)
+        # Keep the text: it is the recommendation fallback for resumes whose
+        # extracted skills all miss the course vocabulary
+        analysis = get_resume_processor().process_resume(filepath, keep_text=True)
         if not analysis:
             raise ValueError("Resume processing failed")
 
         # Generate recommendations
-        recommendations = recommendation_engine.get_recommendations(analysis)
+        recommendations = get_recommendation_engine().get_recommendations(analysis)
 
-        return jsonify({
+        job_store.update(job_id, "done", result={
             "success": True,
             "analysis": {
                 "skills": analysis.get("skills", [])[:20],
@@ -103,17 +146,15 @@ def upload_resume():
             },
             "recommendations": format_recommendations(recommendations),
             "total_recommendations": len(recommendations)
-        }), 200
+        })
 
     except Exception as e:
         print("Upload error:", e)
-        return jsonify({
-            "error": "Failed to process resume"
-        }), 500
+        job_store.update(job_id, "error", error="Failed to process resume")
 
     finally:
         # ✅ ALWAYS CLEAN FILE
-        if filepath and os.path.exists(filepath):
+        if os.path.exists(filepath):
             os.remove(filepath)
 
 # ----------------------------------
@@ -152,7 +193,7 @@ def format_recommendations(recommendations):
 # ----------------------------------
 @app.route("/api/courses")
 def get_courses():
-    courses = course_manager.get_all_courses()
+    courses = get_course_manager().get_all_courses()
     return jsonify({
         "courses": courses,
         "total": len(courses)
@@ -160,7 +201,7 @@ def get_courses():
 
 @app.route("/api/course/<course_id>")
 def get_course(course_id):
-    course = course_manager.get_course_by_id(course_id)
+    course = get_course_manager().get_course_by_id(course_id)
     if course:
         return jsonify(course), 200
     return jsonify({"error": "Course not found"}), 404
@@ -169,7 +210,7 @@ def get_course(course_id):
 def search_courses():
     query = request.args.get("q", "")
     limit = request.args.get("limit", 10, type=int)
-    results = course_manager.search_courses(query, limit)
+    results = get_course_manager().search_courses(query, limit)
     return jsonify({
         "results": results,
         "total": len(results)
@@ -177,7 +218,7 @@ def search_courses():
 
 @app.route("/api/stats")
 def get_stats():
-    stats = course_manager.get_statistics()
+    stats = get_course_manager().get_statistics()
     return jsonify(stats), 200
 
 # ----------------------------------
@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 class Config:
     """Configuration settings for the application"""
@@ -7,19 +8,28 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-secret-key-here-change-in-production'
     
     # File upload settings
-    UPLOAD_FOLDER = 'static/uploads'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc'}
     
+    # Background job settings (job files are shared by all workers on a host)
+    JOB_FOLDER = os.path.join(tempfile.gettempdir(), 'mooc_resume_jobs')
+    JOB_TTL_SECONDS = 60 * 60
+    JOB_TIMEOUT_SECONDS = 3 * 60  # Unfinished jobs idle this long are reported as failed
+    JOB_WORKERS = 4
+    
     # Dataset settings
     DATASET_PATH = 'data/output.csv'
+    VECTOR_CACHE_DIR = 'cache'  # Fitted TF-IDF vectorizer, keyed by dataset hash
     
     # Recommendation settings
     TOP_N_RECOMMENDATIONS = 10
     MIN_SIMILARITY_SCORE = 0.1  # Minimum similarity score to show a recommendation
+    RECOMMENDATION_CACHE_SIZE = 512  # Resumes whose recommendations are kept in memory
+    RESUME_CACHE_SIZE = 256  # Resume analyses kept in memory, keyed by file hash
     
     # NLP settings
     SPACY_MODEL = 'en_core_web_sm'
+    SPACY_EXCLUDE = ['ner', 'lemmatizer', 'attribute_ruler', 'parser', 'tagger']
     
     # Skills database - common technical skills to look for in resumes
     TECHNICAL_SKILLS = [
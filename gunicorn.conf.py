@@ -0,0 +1,20 @@
+import multiprocessing
+import os
+
+# Gunicorn configuration (used by the Procfile start command)
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Async workers keep the accept loop free while /upload waits on file I/O
+worker_class = "gevent"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_connections = 1000
+
+# Resume processing can take a while on large files
+timeout = 120
+
+def post_worker_init(worker):
+    # Build the shared components before the worker accepts requests, so
+    # request greenlets and background job threads never race to build them
+    from services import build_components
+    build_components()
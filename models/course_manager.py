@@ -1,8 +1,26 @@
 import pandas as pd
 import ast
+import json
+from itertools import islice
 from typing import List, Dict, Optional
 from config import Config
 
+# Columns read from the dataset and their types. course_rating and
+# Number_of_student_enrolled are left untyped because the source data has
+# entries like "4.6/5" or "12,345" that are coerced to numbers in
+# process_dataframe (a strict dtype would make read_csv fail outright).
+# Columns missing from a CSV are skipped rather than failing the load.
+_CSV_COLUMNS = [
+    'Number_of_student_enrolled', 'course_id', 'course_name', 'course_rating',
+    'instructor', 'is_paid', 'platform', 'sources', 'user_comments'
+]
+_CSV_DTYPES = {
+    'course_name': 'string',
+    'instructor': 'string',
+    'is_paid': 'category',
+    'platform': 'string',
+}
+
 class CourseManager:
     """Manage course data loaded from CSV"""
     
@@ -16,12 +34,18 @@ class CourseManager:
         self.csv_path = csv_path or Config.DATASET_PATH
         self.df = None
         self.courses = []
+        self._course_name_lower = []
+        self._stats_cache = self.empty_statistics()
         self.load_courses()
     
     def load_courses(self):
         """Load courses from CSV file into memory"""
         try:
-            self.df = pd.read_csv(self.csv_path)
+            self.df = pd.read_csv(
+                self.csv_path,
+                usecols=lambda column: column in _CSV_COLUMNS,
+                dtype=_CSV_DTYPES
+            )
             print(f"Loaded {len(self.df)} courses from {self.csv_path}")
             
             # Process the dataframe
@@ -30,14 +54,24 @@ class CourseManager:
             # Convert to list of dictionaries for easier access
             self.courses = self.df.to_dict('records')
             
+            # Lowercased names for search, so queries don't re-lowercase the column
+            self._course_name_lower = self.df['course_name'].astype(str).str.lower().tolist()
+            
+            # Data never changes after load, so compute statistics once
+            self._stats_cache = self.compute_statistics()
+            
         except FileNotFoundError:
             print(f"Error: Dataset file not found at {self.csv_path}")
             self.df = pd.DataFrame()
             self.courses = []
+            self._course_name_lower = []
+            self._stats_cache = self.empty_statistics()
         except Exception as e:
             print(f"Error loading courses: {str(e)}")
             self.df = pd.DataFrame()
             self.courses = []
+            self._course_name_lower = []
+            self._stats_cache = self.empty_statistics()
     
     def process_dataframe(self):
         """Process and clean the dataframe"""
@@ -51,25 +85,30 @@ class CourseManager:
         # Fill missing text fields
         self.df['course_name'] = self.df['course_name'].fillna('')
         self.df['instructor'] = self.df['instructor'].fillna('Unknown')
+        if 'Unknown' not in self.df['is_paid'].cat.categories:
+            self.df['is_paid'] = self.df['is_paid'].cat.add_categories('Unknown')
         self.df['is_paid'] = self.df['is_paid'].fillna('Unknown')
         self.df['platform'] = self.df['platform'].fillna('Unknown')
         
         # Process user_comments if it's a string representation of a list
         if 'user_comments' in self.df.columns:
-            self.df['user_comments'] = self.df['user_comments'].apply(self.parse_list_field)
+            self.df['user_comments'] = self.df['user_comments'].map(self.parse_list_field)
             # Join comments into single text for analysis
-            self.df['comments_text'] = self.df['user_comments'].apply(
+            self.df['comments_text'] = self.df['user_comments'].map(
                 lambda x: ' '.join(x) if isinstance(x, list) else ''
             )
         else:
             self.df['comments_text'] = ''
         
-        # Create combined text field for matching
-        self.df['combined_text'] = (
-            self.df['course_name'].astype(str) + ' ' +
-            self.df['instructor'].astype(str) + ' ' +
-            self.df['comments_text'].astype(str)
-        )
+        # Create combined text field for matching (one string per row, built once)
+        self.df['combined_text'] = [
+            f"{name} {instructor} {comments}"
+            for name, instructor, comments in zip(
+                self.df['course_name'],
+                self.df['instructor'],
+                self.df['comments_text']
+            )
+        ]
         
         # Add popularity score (normalized enrollment)
         max_enrollment = self.df['Number_of_student_enrolled'].max()
@@ -87,12 +126,16 @@ class CourseManager:
             return field
         if isinstance(field, str):
             try:
-                # Try to parse as Python literal
-                parsed = ast.literal_eval(field)
-                if isinstance(parsed, list):
-                    return parsed
-            except:
-                pass
+                # The dataset stores lists as JSON, which the C parser handles fast
+                parsed = json.loads(field)
+            except ValueError:
+                try:
+                    # Fall back to Python literal syntax (e.g. single quotes)
+                    parsed = ast.literal_eval(field)
+                except Exception:
+                    parsed = None
+            if isinstance(parsed, list):
+                return parsed
             # If parsing fails, return as single-item list
             return [field] if field else []
         return []
@@ -128,21 +171,37 @@ class CourseManager:
             List of matching courses
         """
         query_lower = query.lower()
-        matching = self.df[
-            self.df['course_name'].str.lower().str.contains(query_lower, na=False)
-        ]
-        return matching.head(limit).to_dict('records')
+        matching = (
+            idx for idx, name in enumerate(self._course_name_lower)
+            if query_lower in name
+        )
+        return [self.courses[idx] for idx in islice(matching, max(limit, 0))]
     
     def get_dataframe(self) -> pd.DataFrame:
         """Get the raw dataframe"""
         return self.df
     
     def get_statistics(self) -> Dict:
-        """Get statistics about the course dataset"""
+        """Get statistics about the course dataset (cached at load time)"""
+        return dict(self._stats_cache)
+    
+    def compute_statistics(self) -> Dict:
+        """Compute statistics about the course dataset"""
         return {
             'total_courses': len(self.df),
             'platforms': self.df['platform'].unique().tolist(),
             'avg_rating': float(self.df['course_rating'].mean()),
             'paid_courses': int(self.df[self.df['is_paid'] == 'Paid'].shape[0]),
             'free_courses': int(self.df[self.df['is_paid'] == 'Free'].shape[0]),
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def empty_statistics() -> Dict:
+        """Statistics for an empty or unloadable dataset"""
+        return {
+            'total_courses': 0,
+            'platforms': [],
+            'avg_rating': 0.0,
+            'paid_courses': 0,
+            'free_courses': 0,
+        }
@@ -1,10 +1,24 @@
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import joblib
+import sklearn
 import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 from typing import List, Dict, Tuple
 from config import Config
 
+# Course wording that suggests a good fit for each experience level
+_EXPERIENCE_KEYWORDS = {
+    'beginner': ('beginner', 'introduction', 'fundamentals', 'basics', 'getting started'),
+    'intermediate': ('intermediate', 'advanced', 'deep dive', 'mastering'),
+    'advanced': ('advanced', 'expert', 'mastering', 'professional')
+}
+
 class RecommendationEngine:
     """Generate course recommendations based on resume analysis"""
     
@@ -16,6 +30,15 @@ class RecommendationEngine:
             course_manager: CourseManager instance with loaded courses
         """
         self.course_manager = course_manager
+        
+        # Course data is loaded once, so keep direct references to it
+        self._df = course_manager.get_dataframe()
+        self._course_records = course_manager.get_all_courses()
+        
+        # Bounded FIFO cache of recommendations keyed on a resume fingerprint
+        self._recommendation_cache = {}
+        self._recommendation_cache_lock = threading.Lock()
+        
         self.vectorizer = TfidfVectorizer(
             max_features=500,
             stop_words='english',
@@ -28,18 +51,114 @@ class RecommendationEngine:
     
     def prepare_course_vectors(self):
         """Prepare TF-IDF vectors for all courses"""
-        df = self.course_manager.get_dataframe()
+        df = self._df
         
         if df.empty:
             self.course_vectors = None
+            self._static_boost = None
+            self._free_mask = None
+            self._combined_lower = None
+            self._highly_rated_mask = None
+            self._popular_mask = None
+            self._level_hit = {}
             return
         
         # Use combined text field for vectorization
         course_texts = df['combined_text'].fillna('').tolist()
         
-        # Fit and transform
-        self.course_vectors = self.vectorizer.fit_transform(course_texts)
-        print(f"Prepared vectors for {len(course_texts)} courses")
+        # Reuse a previously fitted vectorizer for the same course texts if possible
+        cache_path = self.get_vector_cache_path(course_texts)
+        if not self.load_cached_vectors(cache_path):
+            # Fit and transform
+            self.course_vectors = self.vectorizer.fit_transform(course_texts)
+            print(f"Prepared vectors for {len(course_texts)} courses")
+            
+            self.save_cached_vectors(cache_path)
+        
+        # L2-normalize once so cosine similarity becomes a plain dot product
+        self.course_vectors = normalize(self.course_vectors, norm='l2', copy=False).tocsr()
+        
+        # Precompute per-course boosts (course data never changes after load)
+        self._ratings = df['course_rating'].to_numpy(dtype=np.float32)
+        self._pop = df['popularity_score'].to_numpy(dtype=np.float32)
+        self._free_mask = (df['is_paid'].to_numpy() == 'Free').astype(np.float32) * 0.05
+        self._static_boost = self._ratings / 5.0 * 0.1 + self._pop * 0.1
+        
+        # Lowercased course text and per-course flags used for match reasons
+        combined_lower = df['combined_text'].fillna('').str.lower()
+        self._combined_lower = combined_lower.to_numpy()
+        self._highly_rated_mask = df['course_rating'].to_numpy(dtype=np.float64) >= 4.5
+        self._popular_mask = df['Number_of_student_enrolled'].to_numpy(dtype=np.float64) > 10000
+        self._level_hit = {
+            level: combined_lower.str.contains(
+                '|'.join(re.escape(keyword) for keyword in keywords), regex=True
+            ).to_numpy(dtype=bool)
+            for level, keywords in _EXPERIENCE_KEYWORDS.items()
+        }
+    
+    def get_vector_cache_path(self, course_texts: List[str]) -> str:
+        """
+        Build the on-disk cache path for the fitted vectorizer
+        
+        The key covers the exact texts being vectorized (in row order), the
+        vectorizer settings and the scikit-learn version, so a changed CSV,
+        text preprocessing or vectorizer never reuses a stale cache.
+        
+        Args:
+            course_texts: Course texts the vectorizer is fitted on
+            
+        Returns:
+            Path to the cache file
+        """
+        digest = hashlib.md5()
+        for text in course_texts:
+            digest.update(text.encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(repr(sorted(self.vectorizer.get_params().items())).encode('utf-8'))
+        digest.update(sklearn.__version__.encode('utf-8'))
+        
+        return os.path.join(Config.VECTOR_CACHE_DIR, f"tfidf_{digest.hexdigest()}.pkl")
+    
+    def load_cached_vectors(self, cache_path: str) -> bool:
+        """
+        Load the fitted vectorizer and course vectors from disk
+        
+        Args:
+            cache_path: Path to the cache file
+            
+        Returns:
+            True if the cache was loaded, False otherwise
+        """
+        if not os.path.exists(cache_path):
+            return False
+        
+        try:
+            self.vectorizer, self.course_vectors = joblib.load(cache_path)
+        except Exception as e:
+            print(f"Error loading vector cache: {str(e)}")
+            return False
+        
+        print(f"Loaded vectors for {self.course_vectors.shape[0]} courses from {cache_path}")
+        return True
+    
+    def save_cached_vectors(self, cache_path: str):
+        """
+        Save the fitted vectorizer and course vectors to disk
+        
+        Args:
+            cache_path: Path to the cache file
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            
+            # Write to a temp file and rename so other workers never see a partial file
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(cache_path), suffix='.tmp', delete=False
+            ) as tmp:
+                joblib.dump((self.vectorizer, self.course_vectors), tmp)
+            os.replace(tmp.name, cache_path)
+        except Exception as e:
+            print(f"Error saving vector cache: {str(e)}")
     
     def create_resume_vector(self, resume_analysis: Dict) -> np.ndarray:
         """
@@ -69,16 +188,18 @@ class RecommendationEngine:
             education_text = ' '.join(resume_analysis['education'])
             resume_text_parts.append(education_text)
         
-        # Add full text (once)
-        if resume_analysis.get('full_text'):
-            resume_text_parts.append(resume_analysis['full_text'])
-        
         resume_text = ' '.join(resume_text_parts)
         
         # Transform using the same vectorizer
         resume_vector = self.vectorizer.transform([resume_text])
         
-        return resume_vector
+        # The full resume text is mostly noise for matching and tokenizing it
+        # dominates the transform cost, so it is only used when none of the
+        # extracted terms are in the course vocabulary (e.g. javascript, docker)
+        if resume_vector.nnz == 0 and resume_analysis.get('full_text'):
+            resume_vector = self.vectorizer.transform([resume_analysis['full_text']])
+        
+        return normalize(resume_vector, norm='l2', copy=False)
     
     def calculate_similarity_scores(
         self, 
@@ -96,15 +217,16 @@ class RecommendationEngine:
         if self.course_vectors is None:
             return np.array([])
         
-        # Calculate cosine similarity
-        similarities = cosine_similarity(resume_vector, self.course_vectors)
+        # Both sides are L2-normalized, so the dot product is the cosine similarity
+        similarities = self.course_vectors @ resume_vector.T
         
-        return similarities[0]  # Return 1D array
+        return similarities.toarray().ravel()  # Return 1D array
     
     def apply_boosting(
         self, 
         similarities: np.ndarray, 
-        resume_analysis: Dict
+        resume_analysis: Dict,
+        out: np.ndarray = None
     ) -> np.ndarray:
         """
         Apply boosting factors based on various criteria
@@ -112,25 +234,18 @@ class RecommendationEngine:
         Args:
             similarities: Base similarity scores
             resume_analysis: Resume analysis data
+            out: Optional array to write the boosted scores into
+                 (may be `similarities` itself to boost in place)
             
         Returns:
             Boosted similarity scores
         """
-        df = self.course_manager.get_dataframe()
-        boosted_scores = similarities.copy()
-        
-        # Boost based on course rating (higher ratings get slight boost)
-        rating_boost = df['course_rating'].values / 5.0 * 0.1
-        boosted_scores += rating_boost
-        
-        # Boost based on popularity
-        popularity_boost = df['popularity_score'].values * 0.1
-        boosted_scores += popularity_boost
+        # Rating and popularity boosts are precomputed in prepare_course_vectors
+        boosted_scores = np.add(similarities, self._static_boost, out=out)
         
         # Boost free courses slightly for beginners
         if resume_analysis.get('experience_level') == 'beginner':
-            free_boost = (df['is_paid'] == 'Free').astype(float) * 0.05
-            boosted_scores += free_boost
+            np.add(boosted_scores, self._free_mask, out=boosted_scores)
         
         return boosted_scores
     
@@ -152,20 +267,84 @@ class RecommendationEngine:
         if top_n is None:
             top_n = Config.TOP_N_RECOMMENDATIONS
         
+        # Identical resumes give identical results, so serve repeats from cache
+        cache_key = self.get_resume_fingerprint(resume_analysis, top_n)
+        with self._recommendation_cache_lock:
+            cached = self._recommendation_cache.get(cache_key)
+        if cached is not None:
+            return [dict(course) for course in cached]
+        
+        recommendations = self.compute_recommendations(resume_analysis, top_n)
+        
+        if Config.RECOMMENDATION_CACHE_SIZE > 0:
+            with self._recommendation_cache_lock:
+                if len(self._recommendation_cache) >= Config.RECOMMENDATION_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self._recommendation_cache.pop(next(iter(self._recommendation_cache)))
+                self._recommendation_cache[cache_key] = recommendations
+        
+        return [dict(course) for course in recommendations]
+    
+    @staticmethod
+    def get_resume_fingerprint(resume_analysis: Dict, top_n: int) -> str:
+        """
+        Build a cache key from the parts of the analysis that affect results
+        
+        Args:
+            resume_analysis: Analysis from ResumeProcessor
+            top_n: Number of recommendations requested
+            
+        Returns:
+            Hex digest identifying the resume for recommendation purposes
+        """
+        canonical = (
+            tuple(sorted(resume_analysis.get('skills', []))),
+            tuple(sorted(resume_analysis.get('domains', []))),
+            tuple(sorted(resume_analysis.get('education', []))),
+            resume_analysis.get('experience_level'),
+            resume_analysis.get('full_text'),  # May be the vector's only source
+            top_n
+        )
+        return hashlib.blake2b(repr(canonical).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def compute_recommendations(
+        self, 
+        resume_analysis: Dict, 
+        top_n: int
+    ) -> List[Dict]:
+        """
+        Compute course recommendations without consulting the cache
+        
+        Args:
+            resume_analysis: Analysis from ResumeProcessor
+            top_n: Number of recommendations to return
+            
+        Returns:
+            List of recommended courses with scores
+        """
         # Create resume vector
         resume_vector = self.create_resume_vector(resume_analysis)
         
+        # Neither the extracted terms nor the full text share a term with the
+        # course vocabulary, so there is no similarity to rank by
+        if resume_vector.nnz == 0:
+            return []
+        
         # Calculate similarity scores
         similarities = self.calculate_similarity_scores(resume_vector)
         
         if len(similarities) == 0:
             return []
         
-        # Apply boosting
-        final_scores = self.apply_boosting(similarities, resume_analysis)
+        # Apply boosting (in place: the similarity array is freshly allocated per request)
+        final_scores = self.apply_boosting(similarities, resume_analysis, out=similarities)
         
-        # Get top N indices
-        top_indices = np.argsort(final_scores)[::-1][:top_n]
+        # Get top N indices (partition first, then sort only the top slice)
+        k = min(top_n, len(final_scores))
+        if k <= 0:
+            return []
+        top_indices = np.argpartition(-final_scores, k - 1)[:k]
+        top_indices = top_indices[np.argsort(-final_scores[top_indices])]
         
         # Filter by minimum score
         top_indices = [
@@ -173,12 +352,16 @@ class RecommendationEngine:
             if final_scores[idx] >= Config.MIN_SIMILARITY_SCORE
         ]
         
-        # Build recommendations
-        df = self.course_manager.get_dataframe()
+        # Lowercase the resume skills once per request, not once per course
+        resume_skills = [
+            (skill, skill.lower()) for skill in resume_analysis.get('skills', [])
+        ]
+        
+        # Build recommendations (copy the prebuilt record, not a Series)
         recommendations = []
         
         for idx in top_indices:
-            course = df.iloc[idx].to_dict()
+            course = dict(self._course_records[idx])
             
             # Add recommendation metadata
             course['similarity_score'] = float(final_scores[idx])
@@ -186,9 +369,11 @@ class RecommendationEngine:
             
             # Generate match reasons
             course['match_reasons'] = self.generate_match_reasons(
+                idx,
                 course, 
                 resume_analysis, 
-                final_scores[idx]
+                final_scores[idx],
+                resume_skills
             )
             
             recommendations.append(course)
@@ -197,28 +382,37 @@ class RecommendationEngine:
     
     def generate_match_reasons(
         self, 
+        idx: int,
         course: Dict, 
         resume_analysis: Dict, 
-        score: float
+        score: float,
+        resume_skills: List[Tuple[str, str]] = None
     ) -> List[str]:
         """
         Generate human-readable reasons for the match
         
         Args:
+            idx: Row index of the course
             course: Course dictionary
             resume_analysis: Resume analysis
             score: Similarity score
+            resume_skills: Precomputed (skill, lowercased skill) pairs
             
         Returns:
             List of match reasons
         """
         reasons = []
         
+        if resume_skills is None:
+            resume_skills = [
+                (skill, skill.lower()) for skill in resume_analysis.get('skills', [])
+            ]
+        
         # Check skill matches
-        course_text_lower = course['combined_text'].lower()
+        course_text_lower = self._combined_lower[idx]
         matched_skills = [
-            skill for skill in resume_analysis.get('skills', [])
-            if skill.lower() in course_text_lower
+            skill for skill, skill_lower in resume_skills
+            if skill_lower in course_text_lower
         ]
         
         if matched_skills:
@@ -235,24 +429,18 @@ class RecommendationEngine:
             reasons.append(f"Aligns with your domain: {', '.join(domain_names)}")
         
         # High rating
-        if course['course_rating'] >= 4.5:
+        if self._highly_rated_mask[idx]:
             reasons.append(f"Highly rated ({course['course_rating']}/5)")
         
         # Popular course
-        if course.get('Number_of_student_enrolled', 0) > 10000:
+        if self._popular_mask[idx]:
             reasons.append(f"Popular course with {int(course['Number_of_student_enrolled']):,} students")
         
-        # Experience level match
-        experience_keywords = {
-            'beginner': ['beginner', 'introduction', 'fundamentals', 'basics', 'getting started'],
-            'intermediate': ['intermediate', 'advanced', 'deep dive', 'mastering'],
-            'advanced': ['advanced', 'expert', 'mastering', 'professional']
-        }
-        
+        # Experience level match (keyword hits are precomputed per course)
         user_level = resume_analysis.get('experience_level', 'intermediate')
-        level_keywords = experience_keywords.get(user_level, [])
+        level_hit = self._level_hit.get(user_level)
         
-        if any(keyword in course_text_lower for keyword in level_keywords):
+        if level_hit is not None and level_hit[idx]:
             reasons.append(f"Suitable for {user_level} level")
         
         # If no specific reasons, give general one
@@ -1,29 +1,135 @@
+import hashlib
 import os
-from typing import Dict, Optional
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional
 from utils.text_extraction import TextExtractor
-from utils.skill_extractor import SkillExtractor
+from utils.skill_extractor import get_skill_extractor
+from config import Config
+
+# Runs of whitespace and/or characters other than alphanumerics and basic punctuation
+_CLEAN_RE = re.compile(r'[^\w\.\,\-\+\#\(\)]+')
+
+# Turns domain keys like 'data_science' into display text
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
 
 class ResumeProcessor:
     """Process and analyze resume files"""
     
     def __init__(self):
         """Initialize the resume processor"""
-        self.text_extractor = TextExtractor()
-        self.skill_extractor = SkillExtractor()
+        # Both extractors are shared: TextExtractor is stateless (static
+        # methods only) and the skill extractor holds the spaCy model
+        self.text_extractor = TextExtractor
+        self.skill_extractor = get_skill_extractor()
+        
+        # LRU cache of analyses keyed on the SHA-256 of the file contents
+        self._analysis_cache = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
     
-    def process_resume(self, file_path: str) -> Optional[Dict]:
+    def process_resume(self, file_path: str, keep_text: bool = False) -> Optional[Dict]:
         """
         Process a resume file and extract relevant information
         
         Args:
             file_path: Path to the resume file
+            keep_text: Include the cleaned resume text as 'full_text'
             
         Returns:
             Dictionary containing extracted information or None if error
         """
+        # Re-uploads of the same file skip extraction and analysis
+        # (cached analyses hold the text, which is dropped unless keep_text)
+        cache_key = self.get_file_hash(file_path)
+        if cache_key is not None:
+            with self._analysis_cache_lock:
+                cached = self._analysis_cache.get(cache_key)
+                if cached is not None:
+                    self._analysis_cache.move_to_end(cache_key)
+            if cached is not None:
+                analysis = {**cached, 'file_name': os.path.basename(file_path)}
+                if not keep_text:
+                    analysis.pop('full_text', None)
+                return analysis
+        
         # Extract text from file
         text = self.text_extractor.extract_text(file_path)
         
+        analysis = self.analyze_text(text, file_path, keep_text=True)
+        if analysis is None:
+            return None
+        
+        if cache_key is not None and Config.RESUME_CACHE_SIZE > 0:
+            with self._analysis_cache_lock:
+                self._analysis_cache[cache_key] = analysis
+                if len(self._analysis_cache) > Config.RESUME_CACHE_SIZE:
+                    self._analysis_cache.popitem(last=False)
+            analysis = dict(analysis)
+        
+        if not keep_text:
+            analysis.pop('full_text', None)
+        
+        return analysis
+    
+    @staticmethod
+    def get_file_hash(file_path: str) -> Optional[str]:
+        """
+        Hash a file's contents for use as a cache key
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Hex SHA-256 digest, or None if the file can't be read
+        """
+        digest = hashlib.sha256()
+        try:
+            with open(file_path, 'rb') as file:
+                for chunk in iter(lambda: file.read(64 * 1024), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+    
+    def process_resumes(
+        self, 
+        file_paths: List[str], 
+        keep_text: bool = False
+    ) -> Iterator[Optional[Dict]]:
+        """
+        Process several resume files, extracting their text in parallel
+        
+        Args:
+            file_paths: Paths to the resume files
+            keep_text: Include the cleaned resume text as 'full_text'
+            
+        Yields:
+            Analysis dictionary (or None if error) for each file, in input order
+        """
+        # Parsing PDF/DOCX files is CPU-heavy, so extract them across processes
+        texts = self.text_extractor.extract_many(file_paths)
+        
+        for file_path, text in zip(file_paths, texts):
+            yield self.analyze_text(text, file_path, keep_text)
+    
+    def analyze_text(
+        self, 
+        text: Optional[str], 
+        file_path: str, 
+        keep_text: bool = False
+    ) -> Optional[Dict]:
+        """
+        Analyze text extracted from a resume file
+        
+        Args:
+            text: Extracted text (None if extraction failed)
+            file_path: Path to the resume file
+            keep_text: Include the cleaned resume text as 'full_text'
+            
+        Returns:
+            Dictionary containing extracted information or None if error
+        """
         if not text:
             return None
         
@@ -36,7 +142,8 @@ class ResumeProcessor:
         # Add file information
         analysis['file_name'] = os.path.basename(file_path)
         analysis['text_length'] = len(text)
-        analysis['full_text'] = text
+        if keep_text:
+            analysis['full_text'] = text
         
         return analysis
     
@@ -51,15 +158,9 @@ class ResumeProcessor:
         Returns:
             Cleaned text
         """
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        # Remove special characters but keep alphanumeric and basic punctuation
-        # This helps in skill matching
-        import re
-        text = re.sub(r'[^\w\s\.\,\-\+\#\(\)]', ' ', text)
-        
-        return text
+        # Collapse whitespace and special characters into single spaces in one
+        # pass, keeping alphanumeric and basic punctuation. This helps in skill matching
+        return _CLEAN_RE.sub(' ', text).strip()
     
     def get_resume_summary(self, analysis: Dict) -> str:
         """
@@ -81,7 +182,7 @@ class ResumeProcessor:
         
         # Top domains
         if analysis['domains']:
-            domains_str = ', '.join([d.replace('_', ' ').title() for d in analysis['domains']])
+            domains_str = ', '.join(d.translate(_UNDERSCORE_TO_SPACE).title() for d in analysis['domains'])
             summary_parts.append(f"Primary Domains: {domains_str}")
         
         # Top skills (first 10)
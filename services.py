@@ -0,0 +1,92 @@
+import functools
+import sys
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from config import Config
+from models.course_manager import CourseManager
+from models.resume_processor import ResumeProcessor
+from models.recommendation_engine import RecommendationEngine
+from utils.job_store import JobStore
+
+def _threading_is_patched() -> bool:
+    """Check whether gevent has monkey-patched the threading module"""
+    monkey = sys.modules.get('gevent.monkey')
+    return monkey is not None and monkey.is_module_patched('threading')
+
+def _native_rlock():
+    """
+    Create a reentrant lock backed by a real OS lock, even under gevent
+    (a gevent lock can't be waited on by a greenlet while a native job
+    thread holds it)
+    """
+    if _threading_is_patched():
+        from gevent.monkey import get_original
+        return get_original('_thread', 'RLock')()
+    return threading.RLock()
+
+# Serializes first builds (reentrant: the engine factory calls the course one)
+_build_lock = _native_rlock()
+
+def _build_once(factory):
+    """
+    Cache a no-argument factory like functools.lru_cache(maxsize=1), except
+    that callers arriving while the first build runs wait for it instead of
+    building their own copy (request and job threads can race at startup)
+    """
+    cached_factory = functools.lru_cache(maxsize=1)(factory)
+    
+    @functools.wraps(factory)
+    def wrapper():
+        # Once built, skip the lock entirely: under gevent a greenlet must
+        # never wait on a lock held by a native job thread
+        if cached_factory.cache_info().currsize:
+            return cached_factory()
+        with _build_lock:
+            return cached_factory()
+    
+    wrapper.cache_clear = cached_factory.cache_clear
+    return wrapper
+
+# ----------------------------------
+# Shared components (built lazily, once per process)
+# ----------------------------------
+@_build_once
+def get_course_manager() -> CourseManager:
+    print("Loading course data...")
+    return CourseManager()
+
+@_build_once
+def get_resume_processor() -> ResumeProcessor:
+    print("Initializing resume processor...")
+    return ResumeProcessor()
+
+@_build_once
+def get_recommendation_engine() -> RecommendationEngine:
+    print("Initializing recommendation engine...")
+    return RecommendationEngine(get_course_manager())
+
+@_build_once
+def get_job_store() -> JobStore:
+    return JobStore()
+
+@_build_once
+def get_job_executor() -> Executor:
+    # Under gevent's monkey patching, stdlib threads are greenlets sharing
+    # one OS thread, so a CPU-bound job would stall every other request on
+    # the worker. gevent's own pool runs jobs on real native threads.
+    if _threading_is_patched():
+        from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+        return NativeThreadPoolExecutor(max_workers=Config.JOB_WORKERS)
+    return ThreadPoolExecutor(max_workers=Config.JOB_WORKERS)
+
+def build_components():
+    """
+    Build every shared component up front (called by gunicorn once per
+    worker before it serves requests, so nothing races to build them)
+    """
+    get_course_manager()
+    get_resume_processor()
+    get_recommendation_engine()
+    get_job_store()
+    get_job_executor()
@@ -9,6 +9,10 @@ const errorContainer = document.getElementById('errorContainer');
 const errorMessage = document.getElementById('errorMessage');
 const resultsSection = document.getElementById('resultsSection');
 
+// Background job polling (give up after about 3 minutes)
+const POLL_INTERVAL_MS = 1000;
+const MAX_POLL_ATTEMPTS = 180;
+
 // File selection handler
 resumeFile.addEventListener('change', function(e) {
     if (this.files && this.files[0]) {
@@ -57,9 +61,17 @@ uploadForm.addEventListener('submit', async function(e) {
             body: formData
         });
         
-        const data = await response.json();
+        let data = await response.json();
         
-        if (response.ok && data.success) {
+        // Processing runs in the background; poll until the job finishes
+        if (response.status === 202 && data.job_id) {
+            data = await pollJob(data.job_id);
+        } else if (!response.ok) {
+            showError(data.error || 'An error occurred while processing your resume');
+            return;
+        }
+        
+        if (data.success) {
             // Show results
             displayResults(data);
         } else {
@@ -72,6 +84,25 @@ uploadForm.addEventListener('submit', async function(e) {
     }
 });
 
+// Poll a background upload job until it is done, has failed or takes too long
+async function pollJob(jobId) {
+    for (let attempt = 0; attempt < MAX_POLL_ATTEMPTS; attempt++) {
+        await new Promise(resolve => setTimeout(resolve, POLL_INTERVAL_MS));
+        
+        const response = await fetch(`/upload/${jobId}`);
+        const data = await response.json();
+        
+        if (!response.ok || data.status === 'done' || data.status === 'error') {
+            return data;
+        }
+    }
+    
+    return {
+        success: false,
+        error: 'Processing your resume is taking too long. Please try again.'
+    };
+}
+
 // Show loading state
 function showLoading() {
     uploadSection.style.display = 'none';
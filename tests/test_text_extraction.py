@@ -0,0 +1,68 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+import zipfile
+
+from utils.text_extraction import TextExtractor
+
+_W_NAMESPACE = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+_ENTITY_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<!DOCTYPE w:document [<!ENTITY x SYSTEM "file://{secret_path}">]>
+<w:document xmlns:w="{namespace}">
+  <w:body>
+    <w:p><w:r><w:t>Hi kubernetes terraform</w:t></w:r></w:p>
+    <w:p><w:r><w:t>&x;</w:t></w:r></w:p>
+  </w:body>
+</w:document>
+"""
+
+_TAB_STOPS_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{namespace}">
+  <w:body>
+    <w:p>
+      <w:pPr><w:tabs><w:tab w:val="left" w:pos="2880"/><w:tab w:val="right" w:pos="9360"/></w:tabs></w:pPr>
+      <w:r><w:t>Python</w:t></w:r>
+      <w:r><w:tab/><w:t>2020</w:t></w:r>
+    </w:p>
+  </w:body>
+</w:document>
+"""
+
+@unittest.skipUnless(importlib.util.find_spec('lxml'), "lxml is not installed")
+class ExtractFromDocxTest(unittest.TestCase):
+    """DOCX parsing of untrusted uploads"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write_docx(self, document_xml: str) -> str:
+        """Write a minimal DOCX holding the given word/document.xml"""
+        docx_path = os.path.join(self.tmpdir.name, 'resume.docx')
+        with zipfile.ZipFile(docx_path, 'w') as archive:
+            archive.writestr('word/document.xml', document_xml)
+        return docx_path
+
+    def test_external_entities_are_not_resolved(self):
+        secret_path = os.path.join(self.tmpdir.name, 'secret.txt')
+        with open(secret_path, 'w', encoding='utf-8') as file:
+            file.write('SECRETVALUE')
+
+        docx_path = self.write_docx(
+            _ENTITY_XML.format(secret_path=secret_path, namespace=_W_NAMESPACE)
+        )
+        text = TextExtractor.extract_from_docx(docx_path)
+
+        self.assertIsNotNone(text)
+        self.assertIn('Hi kubernetes terraform', text)
+        self.assertNotIn('SECRETVALUE', text)
+
+    def test_tab_stop_definitions_are_not_text(self):
+        docx_path = self.write_docx(_TAB_STOPS_XML.format(namespace=_W_NAMESPACE))
+
+        self.assertEqual(TextExtractor.extract_from_docx(docx_path), 'Python\t2020')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import os
+import re
+import tempfile
+import time
+import uuid
+from typing import Dict, Optional
+from config import Config
+
+class JobStore:
+    """Track background resume jobs as JSON files shared by all workers"""
+
+    JOB_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+    def __init__(self, folder: str = None, ttl: int = None, timeout: int = None):
+        """
+        Initialize the job store
+
+        Args:
+            folder: Directory holding job files (defaults to config setting)
+            ttl: Seconds a job file is kept (defaults to config setting)
+            timeout: Seconds an unfinished job may go without an update
+                     (defaults to config setting)
+        """
+        self.folder = folder or Config.JOB_FOLDER
+        self.ttl = ttl if ttl is not None else Config.JOB_TTL_SECONDS
+        self.timeout = timeout if timeout is not None else Config.JOB_TIMEOUT_SECONDS
+        os.makedirs(self.folder, exist_ok=True)
+
+    def create(self) -> str:
+        """
+        Register a new queued job
+
+        Returns:
+            Job identifier
+        """
+        self.prune()
+        job_id = uuid.uuid4().hex
+        self.update(job_id, 'queued')
+        return job_id
+
+    def update(self, job_id: str, status: str, **data):
+        """
+        Record the current state of a job
+
+        Args:
+            job_id: Job identifier
+            status: queued, processing, done or error
+            **data: Extra fields to store (e.g. result, error)
+        """
+        job = {'job_id': job_id, 'status': status, 'updated_at': time.time(), **data}
+
+        # Write to a temp file and rename so readers never see a partial file
+        with tempfile.NamedTemporaryFile(
+            'w', dir=self.folder, suffix='.tmp', delete=False, encoding='utf-8'
+        ) as tmp:
+            json.dump(job, tmp, default=str)
+        os.replace(tmp.name, self.get_path(job_id))
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        Look up a job
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job dictionary or None if unknown
+        """
+        if not self.JOB_ID_PATTERN.match(job_id):
+            return None
+
+        try:
+            with open(self.get_path(job_id), encoding='utf-8') as file:
+                job = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # Jobs run in-process, so a restarted or killed worker leaves its
+        # jobs queued/processing forever; report those as failed instead
+        if (
+            job.get('status') in ('queued', 'processing')
+            and time.time() - job.get('updated_at', 0) > self.timeout
+        ):
+            job.update(status='error', error='Resume processing timed out')
+
+        return job
+
+    def get_path(self, job_id: str) -> str:
+        """Get the file path for a job"""
+        return os.path.join(self.folder, f"{job_id}.json")
+
+    def prune(self):
+        """Remove job files older than the configured TTL"""
+        cutoff = time.time() - self.ttl
+        for entry in os.scandir(self.folder):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
@@ -1,86 +1,184 @@
-import spacy
+import functools
 import re
-from typing import List, Dict, Set
+import numpy as np
+from collections import Counter
+from typing import Iterator, List, Dict, Set
 from config import Config
 
+try:
+    import re2 as _dfa_re  # Google RE2: linear-time DFA matching
+except ImportError:
+    _dfa_re = re
+
+try:
+    import ahocorasick  # Aho-Corasick automaton (C extension)
+except ImportError:
+    # Pure-Python trie fallback. It is not a drop-in replacement: FlashText
+    # only reports the longest non-overlapping whole-word match at each
+    # position, so e.g. "sql server" no longer also yields "sql", which
+    # shifts domain scores. Install pyahocorasick for the reference results.
+    ahocorasick = None
+    from flashtext import KeywordProcessor
+
+_EDUCATION_KEYWORDS = [
+    'bachelor', 'master', 'phd', 'mba', 'degree', 'diploma',
+    'computer science', 'engineering', 'mathematics', 'statistics',
+    'information technology', 'data science', 'business administration'
+]
+
+# Level indicators, matched as substrings in one pass per level
+_ADVANCED_RE = _dfa_re.compile(r'senior|lead|principal|architect')
+_BEGINNER_RE = _dfa_re.compile(r'junior|intern|entry|fresher')
+
+_YEARS_RE = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)')
+
+def _build_matcher(keywords):
+    """Build a single-pass keyword matcher over lowercased keywords"""
+    if ahocorasick is None:
+        processor = KeywordProcessor(case_sensitive=False)
+        processor.add_keywords_from_list(list(keywords))
+        return processor
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+def _find_keywords(matcher, text_lower: str, whole_words: bool) -> Iterator[str]:
+    """
+    Yield every keyword occurrence found by a matcher from _build_matcher
+    
+    Args:
+        matcher: Keyword matcher
+        text_lower: Lowercased text to scan
+        whole_words: Only accept matches not surrounded by word characters
+        
+    Yields:
+        Matched keywords (repeated once per occurrence)
+    """
+    if ahocorasick is None:
+        # FlashText only reports whole-word, longest-match occurrences, so
+        # overlapping keywords are dropped and whole_words=False can't be
+        # honoured (callers needing substring semantics must not use it)
+        yield from matcher.extract_keywords(text_lower)
+        return
+    
+    for end, keyword in matcher.iter(text_lower):
+        if whole_words:
+            start = end - len(keyword) + 1
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1]):
+                continue
+        
+        yield keyword
+
+def _is_word_char(char: str) -> bool:
+    """Match the definition of a word character used by regex \\b"""
+    return char.isalnum() or char == '_'
+
 class SkillExtractor:
     """Extract skills and relevant information from resume text"""
     
     def __init__(self):
-        """Initialize the skill extractor with spaCy model"""
-        try:
-            self.nlp = spacy.load(Config.SPACY_MODEL)
-        except OSError:
-            print(f"Downloading spaCy model: {Config.SPACY_MODEL}")
-            import subprocess
-            subprocess.run(['python', '-m', 'spacy', 'download', Config.SPACY_MODEL])
-            self.nlp = spacy.load(Config.SPACY_MODEL)
+        """Initialize the skill extractor (the spaCy model loads on first use)"""
+        self._nlp = None
         
         self.technical_skills = set([skill.lower() for skill in Config.TECHNICAL_SKILLS])
         self.domain_keywords = Config.DOMAIN_KEYWORDS
+        
+        # Keyword matchers let each text be scanned once for all keywords
+        self._skill_matcher = _build_matcher(self.technical_skills)
+        # (FlashText can't do substring matching, so without pyahocorasick
+        # the few education keywords are checked with plain `in`)
+        self._education_matcher = (
+            _build_matcher(_EDUCATION_KEYWORDS) if ahocorasick is not None else None
+        )
+        
+        # Inverted index from domain keyword to the domains listing it
+        self._kw_index = {}
+        for domain, keywords in self.domain_keywords.items():
+            for keyword in keywords:
+                self._kw_index.setdefault(keyword.lower(), []).append(domain)
+        
+        # Skill x domain hit counts for every known skill, so scoring a
+        # resume is a row gather and a column sum in NumPy
+        self._domain_names = list(self.domain_keywords)
+        self._domain_ids = {domain: i for i, domain in enumerate(self._domain_names)}
+        self._skill_ids = {skill: i for i, skill in enumerate(sorted(self.technical_skills))}
+        self._skill_domain_matrix = np.zeros(
+            (len(self._skill_ids), len(self._domain_names)), dtype=np.int64
+        )
+        for skill, skill_id in self._skill_ids.items():
+            for domain in self._match_domains(skill):
+                self._skill_domain_matrix[skill_id, self._domain_ids[domain]] += 1
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first access without unused components"""
+        if self._nlp is None:
+            import spacy
+            try:
+                self._nlp = spacy.load(Config.SPACY_MODEL, exclude=Config.SPACY_EXCLUDE)
+            except OSError:
+                # Normally unreachable: requirements.txt pins the model wheel
+                print(f"Downloading spaCy model: {Config.SPACY_MODEL}")
+                from spacy.cli import download as spacy_download
+                spacy_download(Config.SPACY_MODEL)
+                self._nlp = spacy.load(Config.SPACY_MODEL, exclude=Config.SPACY_EXCLUDE)
+        return self._nlp
     
-    def extract_skills(self, text: str) -> List[str]:
+    def extract_skills(self, text_lower: str) -> List[str]:
         """
         Extract technical skills from text
         
         Args:
-            text: Resume text
+            text_lower: Lowercased resume text
             
         Returns:
             List of extracted skills
         """
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Find technical skills using exact matching
-        for skill in self.technical_skills:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
+        # Find technical skills in a single pass over the text, requiring
+        # whole-word matches to avoid partial matches (deduplicated as found)
+        found_skills = set(
+            _find_keywords(self._skill_matcher, text_lower, whole_words=True)
+        )
         
-        return list(set(found_skills))  # Remove duplicates
+        return list(found_skills)
     
-    def extract_education(self, text: str) -> List[str]:
+    def extract_education(self, text_lower: str) -> List[str]:
         """
         Extract education-related keywords
         
         Args:
-            text: Resume text
+            text_lower: Lowercased resume text
             
         Returns:
             List of education indicators
         """
-        education_keywords = [
-            'bachelor', 'master', 'phd', 'mba', 'degree', 'diploma',
-            'computer science', 'engineering', 'mathematics', 'statistics',
-            'information technology', 'data science', 'business administration'
-        ]
-        
-        text_lower = text.lower()
-        found_education = []
+        # Plain substring matches, reported in keyword list order
+        if self._education_matcher is None:
+            return [keyword for keyword in _EDUCATION_KEYWORDS if keyword in text_lower]
         
-        for keyword in education_keywords:
-            if keyword in text_lower:
-                found_education.append(keyword)
+        found_education = set(
+            _find_keywords(self._education_matcher, text_lower, whole_words=False)
+        )
         
-        return found_education
+        return [keyword for keyword in _EDUCATION_KEYWORDS if keyword in found_education]
     
-    def extract_experience_level(self, text: str) -> str:
+    def extract_experience_level(self, text_lower: str) -> str:
         """
         Estimate experience level from resume
         
         Args:
-            text: Resume text
+            text_lower: Lowercased resume text
             
         Returns:
             Experience level (beginner, intermediate, advanced)
         """
-        text_lower = text.lower()
-        
         # Look for years of experience
-        years_pattern = r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)'
-        years_match = re.search(years_pattern, text_lower)
+        years_match = _YEARS_RE.search(text_lower)
         
         if years_match:
             years = int(years_match.group(1))
@@ -92,14 +190,14 @@ class SkillExtractor:
                 return 'advanced'
         
         # Check for level indicators
-        if any(word in text_lower for word in ['senior', 'lead', 'principal', 'architect']):
+        if _ADVANCED_RE.search(text_lower):
             return 'advanced'
-        elif any(word in text_lower for word in ['junior', 'intern', 'entry', 'fresher']):
+        elif _BEGINNER_RE.search(text_lower):
             return 'beginner'
         else:
             return 'intermediate'
     
-    def identify_domains(self, skills: List[str]) -> Dict[str, int]:
+    def identify_domains(self, skills: List[str]) -> Counter:
         """
         Identify relevant domains based on skills
         
@@ -107,21 +205,47 @@ class SkillExtractor:
             skills: List of extracted skills
             
         Returns:
-            Dictionary with domain names and their relevance scores
+            Counter of domain names and their relevance scores
         """
-        domain_scores = {}
+        known_ids = []
+        unknown_skills = []
+        for skill in skills:
+            skill_lower = skill.lower()
+            skill_id = self._skill_ids.get(skill_lower)
+            if skill_id is None:
+                unknown_skills.append(skill_lower)
+            else:
+                known_ids.append(skill_id)
         
-        for domain, keywords in self.domain_keywords.items():
-            score = 0
-            for skill in skills:
-                for keyword in keywords:
-                    if keyword.lower() in skill.lower() or skill.lower() in keyword.lower():
-                        score += 1
-            
-            if score > 0:
-                domain_scores[domain] = score
+        counts = self._skill_domain_matrix[known_ids].sum(axis=0)
+        
+        # Skills outside the configured list fall back to keyword matching
+        for skill_lower in unknown_skills:
+            for domain in self._match_domains(skill_lower):
+                counts[self._domain_ids[domain]] += 1
         
-        return domain_scores
+        # Keep config order so most_common() ranks ties the same way as before
+        return Counter({
+            domain: int(counts[i])
+            for i, domain in enumerate(self._domain_names)
+            if counts[i] > 0
+        })
+    
+    def _match_domains(self, skill_lower: str) -> List[str]:
+        """
+        Find the domains credited by a skill
+        
+        Args:
+            skill_lower: Lowercased skill
+            
+        Returns:
+            One domain entry per domain keyword that overlaps the skill
+        """
+        hits = []
+        for keyword, domains in self._kw_index.items():
+            if keyword in skill_lower or skill_lower in keyword:
+                hits.extend(domains)
+        return hits
     
     def analyze_resume(self, text: str) -> Dict:
         """
@@ -133,14 +257,16 @@ class SkillExtractor:
         Returns:
             Dictionary containing all extracted information
         """
-        skills = self.extract_skills(text)
-        education = self.extract_education(text)
-        experience_level = self.extract_experience_level(text)
+        # Lowercase once and share it across the extractors
+        text_lower = text.lower()
+        
+        skills = self.extract_skills(text_lower)
+        education = self.extract_education(text_lower)
+        experience_level = self.extract_experience_level(text_lower)
         domains = self.identify_domains(skills)
         
         # Get top domains
-        sorted_domains = sorted(domains.items(), key=lambda x: x[1], reverse=True)
-        top_domains = [domain for domain, score in sorted_domains[:3]]
+        top_domains = [domain for domain, _ in domains.most_common(3)]
         
         return {
             'skills': skills,
@@ -148,6 +274,10 @@ class SkillExtractor:
             'education': education,
             'experience_level': experience_level,
             'domains': top_domains,
-            'domain_scores': domains,
-            'raw_text': text[:500]  # First 500 chars for reference
-        }
\ No newline at end of file
+            'domain_scores': domains
+        }
+
+@functools.lru_cache(maxsize=1)
+def get_skill_extractor() -> SkillExtractor:
+    """Get the shared skill extractor, so the spaCy model is loaded once per process"""
+    return SkillExtractor()
@@ -1,7 +1,28 @@
-import PyPDF2
-import docx
+import functools
+import importlib
 import os
-from typing import Optional
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+# Parser libraries are imported on first use, so a PDF-only workload
+# never pays for importing the DOCX stack (and vice versa)
+@functools.lru_cache(maxsize=None)
+def _optional_import(module_name: str):
+    """Import a module once, returning None if it is not installed"""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+# WordprocessingML element tags
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = _W_NS + 'p'
+_W_R = _W_NS + 'r'
+_W_T = _W_NS + 't'
+_W_TAB = _W_NS + 'tab'
+_W_BR = _W_NS + 'br'
+_W_CR = _W_NS + 'cr'
 
 class TextExtractor:
     """Extract text from different file formats"""
@@ -18,21 +39,52 @@ class TextExtractor:
             Extracted text or None if error occurs
         """
         try:
-            text = ""
+            # Prefer PDFium (C++) text extraction when it is installed
+            if _optional_import('pypdfium2') is not None:
+                return TextExtractor.extract_from_pdf_pdfium(file_path)
+            
+            import PyPDF2
+            
+            parts = []
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 
-                # Extract text from all pages
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text()
+                # Extract text from all pages (joined once, not concatenated per page)
+                for page in pdf_reader.pages:
+                    parts.append(page.extract_text() or "")
             
-            return text.strip()
+            return "".join(parts).strip()
         
         except Exception as e:
             print(f"Error extracting text from PDF: {str(e)}")
             return None
     
+    @staticmethod
+    def extract_from_pdf_pdfium(file_path: str) -> str:
+        """
+        Extract text from PDF file using PDFium
+        
+        Args:
+            file_path: Path to the PDF file
+            
+        Returns:
+            Extracted text
+        """
+        pdfium = _optional_import('pypdfium2')
+        
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            pages_text = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages_text.append(textpage.get_text_bounded())
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        
+        return '\n'.join(pages_text).strip()
+    
     @staticmethod
     def extract_from_docx(file_path: str) -> Optional[str]:
         """
@@ -45,20 +97,40 @@ class TextExtractor:
             Extracted text or None if error occurs
         """
         try:
-            doc = docx.Document(file_path)
+            from lxml import etree
             
-            # Extract text from all paragraphs
+            # Stream word/document.xml and collect each paragraph's text in
+            # document order (table cells are paragraphs too). The file is
+            # untrusted upload data, so never expand entities or fetch
+            # anything a DOCTYPE points at (e.g. file:// server paths)
             text = []
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text.append(paragraph.text)
-            
-            # Also extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text.append(cell.text)
+            with zipfile.ZipFile(file_path) as archive, \
+                    archive.open('word/document.xml') as document:
+                for _, paragraph in etree.iterparse(
+                    document,
+                    tag=_W_P,
+                    resolve_entities=False,
+                    load_dtd=False,
+                    no_network=True
+                ):
+                    # Only run content counts: <w:tab> also appears as a tab
+                    # stop definition under <w:pPr><w:tabs>
+                    parts = []
+                    for run in paragraph.iter(_W_R):
+                        for node in run.iterchildren(_W_T, _W_TAB, _W_BR, _W_CR):
+                            if node.tag == _W_T:
+                                parts.append(node.text or '')
+                            elif node.tag == _W_TAB:
+                                parts.append('\t')
+                            else:
+                                parts.append('\n')
+                    
+                    paragraph_text = ''.join(parts)
+                    if paragraph_text.strip():
+                        text.append(paragraph_text)
+                    
+                    # Free the parsed subtree as we go
+                    paragraph.clear()
             
             return '\n'.join(text)
         
@@ -83,10 +155,34 @@ class TextExtractor:
         
         file_extension = os.path.splitext(file_path)[1].lower()
         
-        if file_extension == '.pdf':
-            return TextExtractor.extract_from_pdf(file_path)
-        elif file_extension in ['.docx', '.doc']:
-            return TextExtractor.extract_from_docx(file_path)
-        else:
+        handler = _DISPATCH.get(file_extension)
+        if handler is None:
             print(f"Unsupported file format: {file_extension}")
-            return None
\ No newline at end of file
+            return None
+        
+        return handler(file_path)
+    
+    @staticmethod
+    def extract_many(file_paths: List[str]) -> List[Optional[str]]:
+        """
+        Extract text from several files in parallel processes
+        
+        Args:
+            file_paths: Paths to the files
+            
+        Returns:
+            Extracted text (or None if error) for each file, in input order
+        """
+        if len(file_paths) <= 1:
+            return [TextExtractor.extract_text(path) for path in file_paths]
+        
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(TextExtractor.extract_text, file_paths))
+
+# Extractor for each supported file extension
+_DISPATCH = {
+    '.pdf': TextExtractor.extract_from_pdf,
+    '.docx': TextExtractor.extract_from_docx,
+    '.doc': TextExtractor.extract_from_docx,
+}